@@ -2,6 +2,7 @@
 
 from .client import (
     OvertureGeocoder,
+    AsyncOvertureGeocoder,
     GeocoderResult,
     ReverseGeocoderResult,
     HierarchyEntry,
@@ -15,6 +16,7 @@ from .client import (
 __version__ = "0.1.0"
 __all__ = [
     "OvertureGeocoder",
+    "AsyncOvertureGeocoder",
     "GeocoderResult",
     "ReverseGeocoderResult",
     "HierarchyEntry",
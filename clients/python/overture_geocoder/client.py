@@ -5,14 +5,27 @@ Forward geocoder using Overture Maps data with Nominatim-compatible API.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 import httpx
 
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
 __all__ = [
     "OvertureGeocoder",
+    "AsyncOvertureGeocoder",
     "GeocoderResult",
     "ReverseGeocoderResult",
     "GeocoderError",
@@ -30,6 +43,8 @@ DEFAULT_BASE_URL = "https://geocoder.bradr.dev"
 DEFAULT_TIMEOUT = 30.0
 DEFAULT_RETRIES = 0
 DEFAULT_RETRY_DELAY = 1.0
+DEFAULT_CONCURRENCY = 10
+GEOMETRY_CACHE_SIZE = 256
 
 T = TypeVar("T")
 
@@ -83,10 +98,13 @@ class GeocoderResult:
     boundingbox: list[float]
     importance: float
     type: Optional[str] = None
-    _geocoder: Optional["OvertureGeocoder"] = field(default=None, repr=False)
+    _geocoder: Optional["_GeocoderBase"] = field(default=None, repr=False)
 
     def get_geometry(self) -> Optional[dict[str, Any]]:
-        """Fetch geometry for this result."""
+        """Fetch geometry for this result.
+
+        Returns an awaitable when the result came from AsyncOvertureGeocoder.
+        """
         if self._geocoder is None:
             raise ValueError("No geocoder instance - use OvertureGeocoder.search()")
         return self._geocoder.get_geometry(self.gers_id)
@@ -114,10 +132,13 @@ class ReverseGeocoderResult:
     distance_km: float
     confidence: str  # "exact", "bbox", or "approximate"
     hierarchy: Optional[list[HierarchyEntry]] = None
-    _geocoder: Optional["OvertureGeocoder"] = field(default=None, repr=False)
+    _geocoder: Optional["_GeocoderBase"] = field(default=None, repr=False)
 
     def get_geometry(self) -> Optional[dict[str, Any]]:
-        """Fetch geometry for this result."""
+        """Fetch geometry for this result.
+
+        Returns an awaitable when the result came from AsyncOvertureGeocoder.
+        """
         if self._geocoder is None:
             raise ValueError("No geocoder instance - use OvertureGeocoder.reverse()")
         return self._geocoder.get_geometry(self.gers_id)
@@ -126,7 +147,8 @@ class ReverseGeocoderResult:
         """Fetch polygon from Overture S3 and verify point-in-polygon.
 
         Uses the client-side geometry fetching to download the division's
-        polygon and check if the given point is inside it.
+        polygon and check if the given point is inside it. This is a blocking
+        call, including for results from AsyncOvertureGeocoder.
 
         Args:
             lat: Latitude to check
@@ -138,7 +160,7 @@ class ReverseGeocoderResult:
         if self._geocoder is None:
             raise ValueError("No geocoder instance")
 
-        feature = self._geocoder.get_geometry(self.gers_id)
+        feature = self._geocoder._get_geometry(self.gers_id)
         if not feature:
             return False
 
@@ -179,7 +201,280 @@ class GeoJSONFeatureCollection:
 # =============================================================================
 
 
-class OvertureGeocoder:
+class _GeocoderBase:
+    """Configuration, request building, and response parsing shared by clients."""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        headers: Optional[dict[str, str]] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.headers = headers or {}
+
+        self._geometry_cache: OrderedDict[str, Optional[dict[str, Any]]] = OrderedDict()
+        self._geometry_cache_lock = threading.Lock()
+
+    def get_geometry(self, gers_id: str) -> Optional[dict[str, Any]]:
+        """Fetch full geometry from Overture S3 via the overturemaps-py library.
+
+        Uses the GERS registry for efficient lookup - only downloads the specific
+        parquet file containing the requested feature. The most recent lookups
+        are cached per client, so repeated IDs are not fetched again. Cached
+        features are returned as-is and shared between calls; copy one before
+        modifying it.
+
+        Note: Requires `overturemaps` and `shapely` packages:
+            pip install overture-geocoder[geometry]
+
+        Args:
+            gers_id: The GERS ID to look up
+
+        Returns:
+            GeoJSON Feature dict or None if not found
+        """
+        return self._get_geometry(gers_id)
+
+    def get_geometry_many(
+        self,
+        gers_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Fetch geometries for several GERS IDs at once.
+
+        Each ID is an independent registry lookup and S3 read, so lookups run
+        in parallel threads and share the cache used by get_geometry().
+
+        Note: Requires `overturemaps` and `shapely` packages:
+            pip install overture-geocoder[geometry]
+
+        Args:
+            gers_ids: The GERS IDs to look up (duplicates are fetched once)
+            concurrency: Maximum lookups in flight at once (default: 10)
+
+        Returns:
+            Dict mapping each GERS ID to a GeoJSON Feature dict, or None if not found
+        """
+        return self._get_geometry_many(gers_ids, concurrency)
+
+    def get_base_url(self) -> str:
+        """Get the base URL configured for this client."""
+        return self.base_url
+
+    # =========================================================================
+    # Private methods
+    # =========================================================================
+
+    def _get_geometry(self, gers_id: str) -> Optional[dict[str, Any]]:
+        """Blocking, cached geometry lookup behind get_geometry()."""
+        with self._geometry_cache_lock:
+            if gers_id in self._geometry_cache:
+                self._geometry_cache.move_to_end(gers_id)
+                return self._geometry_cache[gers_id]
+
+        feature = self._fetch_geometry(gers_id)
+
+        with self._geometry_cache_lock:
+            self._geometry_cache[gers_id] = feature
+            self._geometry_cache.move_to_end(gers_id)
+            while len(self._geometry_cache) > GEOMETRY_CACHE_SIZE:
+                self._geometry_cache.popitem(last=False)
+
+        return feature
+
+    def _get_geometry_many(
+        self, gers_ids: Iterable[str], concurrency: int
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Blocking, threaded lookups behind get_geometry_many()."""
+        unique_ids = list(dict.fromkeys(gers_ids))
+        if not unique_ids:
+            return {}
+
+        workers = max(1, min(concurrency, len(unique_ids)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(unique_ids, pool.map(self._get_geometry, unique_ids)))
+
+    def _fetch_geometry(self, gers_id: str) -> Optional[dict[str, Any]]:
+        """Look up a feature by GERS ID and convert it to a GeoJSON Feature."""
+        try:
+            import overturemaps
+        except ImportError:
+            raise ImportError(
+                "overturemaps required for geometry fetching. "
+                "Install with: pip install overture-geocoder[geometry]"
+            )
+
+        # Use the GERS registry lookup (handles STAC/binary search internally)
+        reader = overturemaps.record_batch_reader_from_gers(gers_id)
+        if reader is None:
+            return None
+
+        table = reader.read_all()
+        if len(table) == 0:
+            return None
+
+        # Convert to GeoJSON Feature
+        import json
+
+        try:
+            import shapely
+            from shapely import from_wkb, to_geojson
+        except ImportError:
+            raise ImportError(
+                "shapely required for geometry conversion. "
+                "Install with: pip install overture-geocoder[geometry]"
+            )
+
+        row = table.to_pydict()
+        geometry_wkb = row["geometry"][0]
+
+        # Convert WKB to GeoJSON
+        geom = from_wkb(geometry_wkb)
+
+        # Build properties from all columns except geometry
+        properties = {}
+        for k, v in row.items():
+            if k != "geometry" and v:
+                val = v[0]
+                # Handle pyarrow types
+                if hasattr(val, "as_py"):
+                    val = val.as_py()
+                properties[k] = val
+
+        return {
+            "type": "Feature",
+            "id": gers_id,
+            "geometry": json.loads(to_geojson(geom)),
+            "properties": properties,
+        }
+
+    def _should_retry(self, response: httpx.Response, attempt: int) -> bool:
+        """Decide whether to retry after a response.
+
+        Returns False for successful responses and True for server errors with
+        retries left; raises GeocoderError for anything else.
+        """
+        if response.is_success:
+            return False
+
+        # Don't retry client errors (4xx)
+        if 400 <= response.status_code < 500:
+            raise GeocoderError(
+                f"Request failed: {response.status_code} {response.reason_phrase}",
+                status=response.status_code,
+                response=response,
+            )
+
+        # Retry server errors (5xx)
+        if attempt < self.retries:
+            return True
+
+        raise GeocoderError(
+            f"Request failed after {attempt + 1} attempts: "
+            f"{response.status_code} {response.reason_phrase}",
+            status=response.status_code,
+            response=response,
+        )
+
+    def _raise_unless_retrying(self, error: httpx.RequestError, attempt: int) -> None:
+        """Raise the client error for a transport failure once retries are spent."""
+        if attempt < self.retries:
+            return
+
+        if isinstance(error, httpx.TimeoutException):
+            raise GeocoderTimeoutError(
+                f"Request timed out after {self.timeout}s ({attempt + 1} attempts)"
+            ) from error
+        raise GeocoderNetworkError(
+            f"Network error after {attempt + 1} attempts: {error}", cause=error
+        ) from error
+
+    @staticmethod
+    def _search_params(query: str, limit: int, format: str) -> dict[str, Any]:
+        """Build query parameters for /search."""
+        return {
+            "q": query,
+            "format": format,
+            "limit": min(max(1, limit), 40),
+        }
+
+    @staticmethod
+    def _reverse_params(lat: float, lon: float, format: str) -> dict[str, Any]:
+        """Build query parameters for /reverse."""
+        return {
+            "lat": lat,
+            "lon": lon,
+            "format": format,
+        }
+
+    def _parse_results(
+        self, data: list[dict[str, Any]], include_geocoder: bool = False
+    ) -> list[GeocoderResult]:
+        """Parse API response into GeocoderResult objects."""
+        if not isinstance(data, list):
+            return []
+
+        results = []
+        for r in data:
+            result = GeocoderResult(
+                gers_id=r["gers_id"],
+                primary_name=r["primary_name"],
+                lat=r["lat"],  # Server now returns numbers
+                lon=r["lon"],  # Server now returns numbers
+                boundingbox=r["boundingbox"],  # Server now returns numbers
+                importance=r.get("importance", 0),
+                type=r.get("type"),
+                _geocoder=self if include_geocoder else None,
+            )
+            results.append(result)
+
+        return results
+
+    def _parse_reverse_results(
+        self, data: list[dict[str, Any]]
+    ) -> list[ReverseGeocoderResult]:
+        """Parse reverse geocoding API response into ReverseGeocoderResult objects."""
+        if not isinstance(data, list):
+            return []
+
+        results = []
+        for r in data:
+            hierarchy = None
+            if "hierarchy" in r and r["hierarchy"]:
+                hierarchy = [
+                    HierarchyEntry(
+                        gers_id=h.get("gers_id", ""),
+                        subtype=h.get("subtype", ""),
+                        name=h.get("name", ""),
+                    )
+                    for h in r["hierarchy"]
+                ]
+
+            result = ReverseGeocoderResult(
+                gers_id=r["gers_id"],
+                primary_name=r["primary_name"],
+                subtype=r["subtype"],
+                lat=r["lat"],  # Server returns numbers
+                lon=r["lon"],
+                boundingbox=r["boundingbox"],
+                distance_km=r["distance_km"],
+                confidence=r["confidence"],
+                hierarchy=hierarchy,
+                _geocoder=self,
+            )
+            results.append(result)
+
+        return results
+
+
+class OvertureGeocoder(_GeocoderBase):
     """Forward geocoder using Overture Maps address data.
 
     Args:
@@ -190,6 +485,10 @@ class OvertureGeocoder:
         headers: Custom headers to include in all requests
         http_client: Custom httpx.Client instance
 
+    The default HTTP client negotiates HTTP/2 when the optional `h2`
+    package is installed (pip install overture-geocoder[http2]), so
+    concurrent requests share one connection.
+
     Example:
         >>> client = OvertureGeocoder(base_url="https://api.example.com")
         >>> results = client.search("123 Main St, Boston, MA")
@@ -206,15 +505,12 @@ class OvertureGeocoder:
         headers: Optional[dict[str, str]] = None,
         http_client: Optional[httpx.Client] = None,
     ):
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self.retries = retries
-        self.retry_delay = retry_delay
-        self.headers = headers or {}
+        super().__init__(base_url, timeout, retries, retry_delay, headers)
 
         self._owns_client = http_client is None
         self._http = http_client or httpx.Client(
             timeout=timeout,
+            http2=_HTTP2_AVAILABLE,
             headers={"Accept": "application/json", **self.headers},
         )
 
@@ -235,11 +531,7 @@ class OvertureGeocoder:
         Returns:
             List of GeocoderResult objects
         """
-        params: dict[str, Any] = {
-            "q": query,
-            "format": format,
-            "limit": min(max(1, limit), 40),
-        }
+        params = self._search_params(query, limit, format)
 
         response = self._request_with_retry(f"{self.base_url}/search", params=params)
         data = response.json()
@@ -264,11 +556,7 @@ class OvertureGeocoder:
         Returns:
             GeoJSON FeatureCollection dict
         """
-        params: dict[str, Any] = {
-            "q": query,
-            "format": "geojson",
-            "limit": min(max(1, limit), 40),
-        }
+        params = self._search_params(query, limit, "geojson")
 
         response = self._request_with_retry(f"{self.base_url}/search", params=params)
         return response.json()
@@ -294,11 +582,7 @@ class OvertureGeocoder:
         Returns:
             List of ReverseGeocoderResult objects, most specific first
         """
-        params: dict[str, Any] = {
-            "lat": lat,
-            "lon": lon,
-            "format": format,
-        }
+        params = self._reverse_params(lat, lon, format)
 
         response = self._request_with_retry(f"{self.base_url}/reverse", params=params)
         data = response.json()
@@ -322,102 +606,251 @@ class OvertureGeocoder:
         Returns:
             GeoJSON FeatureCollection dict
         """
-        params: dict[str, Any] = {
-            "lat": lat,
-            "lon": lon,
-            "format": "geojson",
-        }
+        params = self._reverse_params(lat, lon, "geojson")
 
         response = self._request_with_retry(f"{self.base_url}/reverse", params=params)
         return response.json()
 
-    def get_geometry(self, gers_id: str) -> Optional[dict[str, Any]]:
-        """Fetch full geometry from Overture S3 via the overturemaps-py library.
+    def close(self) -> None:
+        """Close HTTP client and release resources."""
+        if self._owns_client:
+            self._http.close()
 
-        Uses the GERS registry for efficient lookup - only downloads the specific
-        parquet file containing the requested feature.
+    def __enter__(self) -> "OvertureGeocoder":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    # =========================================================================
+    # Private methods
+    # =========================================================================
+
+    def _request_with_retry(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        attempt: int = 0,
+    ) -> httpx.Response:
+        """Make HTTP request with retry logic."""
+        try:
+            response = self._http.get(url, params=params)
+        except httpx.RequestError as e:
+            self._raise_unless_retrying(e, attempt)
+        else:
+            if not self._should_retry(response, attempt):
+                return response
+
+        time.sleep(self.retry_delay)
+        return self._request_with_retry(url, params, attempt + 1)
 
-        Note: Requires `overturemaps` and `shapely` packages:
-            pip install overture-geocoder[geometry]
+
+class AsyncOvertureGeocoder(_GeocoderBase):
+    """Async forward and reverse geocoder using httpx.AsyncClient.
+
+    Mirrors OvertureGeocoder, with awaitable request and geometry methods
+    and search_many() for running many queries concurrently. Geometry
+    lookups run in worker threads; result.get_geometry() must be awaited,
+    while ReverseGeocoderResult.verify_contains_point() stays blocking.
+
+    Args:
+        base_url: API base URL (default: 'https://geocoder.bradr.dev')
+        timeout: Request timeout in seconds (default: 30.0)
+        retries: Number of retry attempts for failed requests (default: 0)
+        retry_delay: Delay between retries in seconds (default: 1.0)
+        headers: Custom headers to include in all requests
+        http_client: Custom httpx.AsyncClient instance
+
+    Example:
+        >>> async with AsyncOvertureGeocoder() as client:
+        ...     batches = await client.search_many(["Boston, MA", "Paris"])
+    """
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        headers: Optional[dict[str, str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        super().__init__(base_url, timeout, retries, retry_delay, headers)
+
+        self._owns_client = http_client is None
+        self._http = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            http2=_HTTP2_AVAILABLE,
+            headers={"Accept": "application/json", **self.headers},
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        format: str = "jsonv2",
+    ) -> list[GeocoderResult]:
+        """Search for divisions matching the query.
 
         Args:
-            gers_id: The GERS ID to look up
+            query: Free-form search string
+            limit: Maximum results (1-40, default: 10)
+            format: Response format ('json', 'jsonv2', 'geojson')
 
         Returns:
-            GeoJSON Feature dict or None if not found
+            List of GeocoderResult objects
         """
-        try:
-            import overturemaps
-        except ImportError:
-            raise ImportError(
-                "overturemaps required for geometry fetching. "
-                "Install with: pip install overture-geocoder[geometry]"
-            )
+        params = self._search_params(query, limit, format)
 
-        # Use the GERS registry lookup (handles STAC/binary search internally)
-        reader = overturemaps.record_batch_reader_from_gers(gers_id)
-        if reader is None:
-            return None
+        response = await self._request_with_retry(f"{self.base_url}/search", params=params)
+        data = response.json()
 
-        table = reader.read_all()
-        if len(table) == 0:
-            return None
+        if format == "geojson":
+            return data  # type: ignore
 
-        # Convert to GeoJSON Feature
-        import json
+        return self._parse_results(data, include_geocoder=True)
 
-        try:
-            import shapely
-            from shapely import from_wkb, to_geojson
-        except ImportError:
-            raise ImportError(
-                "shapely required for geometry conversion. "
-                "Install with: pip install overture-geocoder[geometry]"
-            )
+    async def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        limit: int = 10,
+    ) -> list[list[GeocoderResult]]:
+        """Search for many queries concurrently.
 
-        row = table.to_pydict()
-        geometry_wkb = row["geometry"][0]
+        Args:
+            queries: Free-form search strings
+            concurrency: Maximum requests in flight at once (default: 10)
+            limit: Maximum results per query (1-40, default: 10)
 
-        # Convert WKB to GeoJSON
-        geom = from_wkb(geometry_wkb)
+        Returns:
+            One list of GeocoderResult objects per query, in input order
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
-        # Build properties from all columns except geometry
-        properties = {}
-        for k, v in row.items():
-            if k != "geometry" and v:
-                val = v[0]
-                # Handle pyarrow types
-                if hasattr(val, "as_py"):
-                    val = val.as_py()
-                properties[k] = val
+        async def search_one(query: str) -> list[GeocoderResult]:
+            async with semaphore:
+                return await self.search(query, limit=limit)
 
-        return {
-            "type": "Feature",
-            "id": gers_id,
-            "geometry": json.loads(to_geojson(geom)),
-            "properties": properties,
-        }
+        return list(await asyncio.gather(*(search_one(q) for q in queries)))
 
-    def get_base_url(self) -> str:
-        """Get the base URL configured for this client."""
-        return self.base_url
+    async def search_geojson(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+    ) -> dict[str, Any]:
+        """Search and return results as GeoJSON FeatureCollection.
 
-    def close(self) -> None:
+        Args:
+            query: Free-form search string
+            limit: Maximum results (1-40, default: 10)
+
+        Returns:
+            GeoJSON FeatureCollection dict
+        """
+        params = self._search_params(query, limit, "geojson")
+
+        response = await self._request_with_retry(f"{self.base_url}/search", params=params)
+        return response.json()
+
+    async def reverse(
+        self,
+        lat: float,
+        lon: float,
+        *,
+        format: str = "jsonv2",
+    ) -> list[ReverseGeocoderResult]:
+        """Reverse geocode coordinates to divisions.
+
+        Args:
+            lat: Latitude (-90 to 90)
+            lon: Longitude (-180 to 180)
+            format: Response format ('jsonv2', 'geojson')
+
+        Returns:
+            List of ReverseGeocoderResult objects, most specific first
+        """
+        params = self._reverse_params(lat, lon, format)
+
+        response = await self._request_with_retry(f"{self.base_url}/reverse", params=params)
+        data = response.json()
+
+        if format == "geojson":
+            return data  # type: ignore
+
+        return self._parse_reverse_results(data)
+
+    async def reverse_geojson(
+        self,
+        lat: float,
+        lon: float,
+    ) -> dict[str, Any]:
+        """Reverse geocode and return results as GeoJSON FeatureCollection.
+
+        Args:
+            lat: Latitude (-90 to 90)
+            lon: Longitude (-180 to 180)
+
+        Returns:
+            GeoJSON FeatureCollection dict
+        """
+        params = self._reverse_params(lat, lon, "geojson")
+
+        response = await self._request_with_retry(f"{self.base_url}/reverse", params=params)
+        return response.json()
+
+    async def get_geometry(  # type: ignore
+        self, gers_id: str
+    ) -> Optional[dict[str, Any]]:
+        """Fetch full geometry from Overture S3 without blocking the event loop.
+
+        The overturemaps-py lookup is synchronous, so it runs in a worker
+        thread. Shares the per-client cache with get_geometry_many().
+
+        Args:
+            gers_id: The GERS ID to look up
+
+        Returns:
+            GeoJSON Feature dict or None if not found
+        """
+        return await asyncio.to_thread(self._get_geometry, gers_id)
+
+    async def get_geometry_many(  # type: ignore
+        self,
+        gers_ids: Iterable[str],
+        *,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """Fetch geometries for several GERS IDs without blocking the event loop.
+
+        Args:
+            gers_ids: The GERS IDs to look up (duplicates are fetched once)
+            concurrency: Maximum lookups in flight at once (default: 10)
+
+        Returns:
+            Dict mapping each GERS ID to a GeoJSON Feature dict, or None if not found
+        """
+        return await asyncio.to_thread(self._get_geometry_many, gers_ids, concurrency)
+
+    async def aclose(self) -> None:
         """Close HTTP client and release resources."""
         if self._owns_client:
-            self._http.close()
+            await self._http.aclose()
 
-    def __enter__(self) -> "OvertureGeocoder":
+    async def __aenter__(self) -> "AsyncOvertureGeocoder":
         return self
 
-    def __exit__(self, *args: Any) -> None:
-        self.close()
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
 
     # =========================================================================
     # Private methods
     # =========================================================================
 
-    def _request_with_retry(
+    async def _request_with_retry(
         self,
         url: str,
         params: Optional[dict[str, Any]] = None,
@@ -425,111 +858,37 @@ class OvertureGeocoder:
     ) -> httpx.Response:
         """Make HTTP request with retry logic."""
         try:
-            response = self._http.get(url, params=params)
-
-            if not response.is_success:
-                # Don't retry client errors (4xx)
-                if 400 <= response.status_code < 500:
-                    raise GeocoderError(
-                        f"Request failed: {response.status_code} {response.reason_phrase}",
-                        status=response.status_code,
-                        response=response,
-                    )
-
-                # Retry server errors (5xx)
-                if attempt < self.retries:
-                    time.sleep(self.retry_delay)
-                    return self._request_with_retry(url, params, attempt + 1)
-
-                raise GeocoderError(
-                    f"Request failed after {attempt + 1} attempts: "
-                    f"{response.status_code} {response.reason_phrase}",
-                    status=response.status_code,
-                    response=response,
-                )
-
-            return response
-
-        except GeocoderError:
-            raise
-        except httpx.TimeoutException as e:
-            if attempt < self.retries:
-                time.sleep(self.retry_delay)
-                return self._request_with_retry(url, params, attempt + 1)
-            raise GeocoderTimeoutError(
-                f"Request timed out after {self.timeout}s ({attempt + 1} attempts)"
-            ) from e
+            response = await self._http.get(url, params=params)
         except httpx.RequestError as e:
-            if attempt < self.retries:
-                time.sleep(self.retry_delay)
-                return self._request_with_retry(url, params, attempt + 1)
-            raise GeocoderNetworkError(
-                f"Network error after {attempt + 1} attempts: {e}", cause=e
-            ) from e
-
-    def _parse_results(
-        self, data: list[dict[str, Any]], include_geocoder: bool = False
-    ) -> list[GeocoderResult]:
-        """Parse API response into GeocoderResult objects."""
-        if not isinstance(data, list):
-            return []
-
-        results = []
-        for r in data:
-            result = GeocoderResult(
-                gers_id=r["gers_id"],
-                primary_name=r["primary_name"],
-                lat=r["lat"],  # Server now returns numbers
-                lon=r["lon"],  # Server now returns numbers
-                boundingbox=r["boundingbox"],  # Server now returns numbers
-                importance=r.get("importance", 0),
-                type=r.get("type"),
-                _geocoder=self if include_geocoder else None,
-            )
-            results.append(result)
+            self._raise_unless_retrying(e, attempt)
+        else:
+            if not self._should_retry(response, attempt):
+                return response
 
-        return results
+        await asyncio.sleep(self.retry_delay)
+        return await self._request_with_retry(url, params, attempt + 1)
 
-    def _parse_reverse_results(
-        self, data: list[dict[str, Any]]
-    ) -> list[ReverseGeocoderResult]:
-        """Parse reverse geocoding API response into ReverseGeocoderResult objects."""
-        if not isinstance(data, list):
-            return []
 
-        results = []
-        for r in data:
-            hierarchy = None
-            if "hierarchy" in r and r["hierarchy"]:
-                hierarchy = [
-                    HierarchyEntry(
-                        gers_id=h.get("gers_id", ""),
-                        subtype=h.get("subtype", ""),
-                        name=h.get("name", ""),
-                    )
-                    for h in r["hierarchy"]
-                ]
+# =============================================================================
+# Convenience functions
+# =============================================================================
 
-            result = ReverseGeocoderResult(
-                gers_id=r["gers_id"],
-                primary_name=r["primary_name"],
-                subtype=r["subtype"],
-                lat=float(r["lat"]),
-                lon=float(r["lon"]),
-                boundingbox=[float(b) for b in r["boundingbox"]],
-                distance_km=float(r["distance_km"]),
-                confidence=r["confidence"],
-                hierarchy=hierarchy,
-                _geocoder=self,
-            )
-            results.append(result)
+_default_client: Optional[OvertureGeocoder] = None
+_default_client_lock = threading.Lock()
 
-        return results
 
+def _get_default_client() -> OvertureGeocoder:
+    """Get the shared client used by the convenience functions.
 
-# =============================================================================
-# Convenience functions
-# =============================================================================
+    Created on first use and closed at interpreter exit, so repeated calls
+    reuse pooled keep-alive connections instead of reconnecting each time.
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = OvertureGeocoder()
+            atexit.register(_default_client.close)
+        return _default_client
 
 
 def geocode(query: str, **kwargs: Any) -> list[GeocoderResult]:
@@ -542,8 +901,7 @@ def geocode(query: str, **kwargs: Any) -> list[GeocoderResult]:
     Returns:
         List of GeocoderResult objects
     """
-    with OvertureGeocoder() as client:
-        return client.search(query, **kwargs)
+    return _get_default_client().search(query, **kwargs)
 
 
 def reverse_geocode(lat: float, lon: float, **kwargs: Any) -> list[ReverseGeocoderResult]:
@@ -557,5 +915,4 @@ def reverse_geocode(lat: float, lon: float, **kwargs: Any) -> list[ReverseGeocod
     Returns:
         List of ReverseGeocoderResult objects
     """
-    with OvertureGeocoder() as client:
-        return client.reverse(lat, lon, **kwargs)
+    return _get_default_client().reverse(lat, lon, **kwargs)
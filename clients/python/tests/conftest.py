@@ -3,6 +3,8 @@
 import pytest
 import httpx
 
+from overture_geocoder import client as client_module
+
 
 # Mock response data - using numbers to match actual server responses
 MOCK_SEARCH_RESULTS = [
@@ -26,6 +28,23 @@ MOCK_SEARCH_RESULTS = [
     },
 ]
 
+MOCK_REVERSE_RESULTS = [
+    {
+        "gers_id": "def-456",
+        "primary_name": "Cambridge",
+        "subtype": "locality",
+        "lat": 42.3736,
+        "lon": -71.1097,
+        "boundingbox": [42.352, 42.404, -71.161, -71.064],
+        "distance_km": 0.42,
+        "confidence": "high",
+        "hierarchy": [
+            {"gers_id": "def-456", "subtype": "locality", "name": "Cambridge"},
+            {"gers_id": "ghi-789", "subtype": "county", "name": "Middlesex County"},
+        ],
+    },
+]
+
 MOCK_GEOJSON_RESPONSE = {
     "type": "FeatureCollection",
     "features": [
@@ -54,7 +73,21 @@ def mock_search_results():
     return MOCK_SEARCH_RESULTS
 
 
+@pytest.fixture
+def mock_reverse_results():
+    """Return mock reverse geocoding results."""
+    return MOCK_REVERSE_RESULTS
+
+
 @pytest.fixture
 def mock_geojson_response():
     """Return mock GeoJSON response."""
     return MOCK_GEOJSON_RESPONSE
+
+
+@pytest.fixture(autouse=True)
+def reset_default_client():
+    """Drop the shared client used by geocode() so tests don't leak mocks."""
+    client_module._default_client = None
+    yield
+    client_module._default_client = None
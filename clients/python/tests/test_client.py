@@ -1,14 +1,17 @@
 """Tests for the Overture Geocoder Python client."""
 
+import asyncio
 import json
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
 from overture_geocoder import (
     OvertureGeocoder,
+    AsyncOvertureGeocoder,
     GeocoderResult,
     GeocoderError,
     GeocoderTimeoutError,
@@ -53,6 +56,14 @@ class TestOvertureGeocoderInit:
         with OvertureGeocoder() as client:
             assert isinstance(client, OvertureGeocoder)
 
+    def test_enables_http2_when_available(self):
+        """Should request HTTP/2 only when the h2 package is installed."""
+        for available in (True, False):
+            with patch("overture_geocoder.client._HTTP2_AVAILABLE", available), \
+                    patch("httpx.Client") as mock_client_class:
+                OvertureGeocoder()
+                assert mock_client_class.call_args[1]["http2"] is available
+
 
 class TestSearch:
     """Tests for search functionality."""
@@ -168,6 +179,33 @@ class TestSearchGeoJSON:
         assert result["features"][0]["geometry"]["type"] == "Point"
 
 
+class TestReverse:
+    """Tests for reverse geocoding."""
+
+    def test_reverse_parses_results(self, mock_reverse_results):
+        """Should parse reverse results and hierarchy."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.json.return_value = mock_reverse_results
+
+        mock_client = MagicMock()
+        mock_client.get.return_value = mock_response
+
+        client = OvertureGeocoder(http_client=mock_client)
+        results = client.reverse(42.37, -71.11)
+
+        params = mock_client.get.call_args[1]["params"]
+        assert params == {"lat": 42.37, "lon": -71.11, "format": "jsonv2"}
+
+        assert len(results) == 1
+        result = results[0]
+        assert result.subtype == "locality"
+        assert result.lat == 42.3736
+        assert result.boundingbox == [42.352, 42.404, -71.161, -71.064]
+        assert result.distance_km == 0.42
+        assert [h.subtype for h in result.hierarchy] == ["locality", "county"]
+
+
 class TestErrorHandling:
     """Tests for error handling."""
 
@@ -329,6 +367,172 @@ class TestRetryBehavior:
         assert len(results) == 2
 
 
+class TestAsyncOvertureGeocoder:
+    """Tests for the async client."""
+
+    def test_search(self, mock_search_results):
+        """Should search with the async HTTP client."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.json.return_value = mock_search_results
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        client = AsyncOvertureGeocoder(http_client=mock_client)
+        results = asyncio.run(client.search("Boston", limit=5))
+
+        call_args = mock_client.get.call_args
+        assert "/search" in call_args[0][0]
+        assert call_args[1]["params"]["q"] == "Boston"
+        assert call_args[1]["params"]["limit"] == 5
+
+        assert len(results) == 2
+        assert results[0].gers_id == "abc-123"
+
+    def test_search_many_preserves_order(self):
+        """Should return one result list per query, in input order."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def mock_get(url, params=None):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Finish later queries first to check ordering
+            await asyncio.sleep(0.01 / len(params["q"]))
+            in_flight -= 1
+
+            mock_response = MagicMock()
+            mock_response.is_success = True
+            mock_response.json.return_value = [{
+                "gers_id": params["q"],
+                "primary_name": params["q"],
+                "lat": 0.0,
+                "lon": 0.0,
+                "boundingbox": [0.0, 0.0, 0.0, 0.0],
+            }]
+            return mock_response
+
+        mock_client = MagicMock()
+        mock_client.get = mock_get
+
+        client = AsyncOvertureGeocoder(http_client=mock_client)
+        queries = ["a", "bb", "ccc", "dddd", "eeeee"]
+        batches = asyncio.run(client.search_many(queries, concurrency=2))
+
+        assert [batch[0].gers_id for batch in batches] == queries
+        assert max_in_flight == 2
+
+    def test_retries_on_5xx_errors(self, mock_search_results):
+        """Should retry on 5xx errors."""
+        error_response = MagicMock()
+        error_response.is_success = False
+        error_response.status_code = 503
+        error_response.reason_phrase = "Service Unavailable"
+
+        ok_response = MagicMock()
+        ok_response.is_success = True
+        ok_response.json.return_value = mock_search_results
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=[error_response, ok_response])
+
+        client = AsyncOvertureGeocoder(
+            http_client=mock_client, retries=1, retry_delay=0.01
+        )
+        results = asyncio.run(client.search("test"))
+
+        assert mock_client.get.call_count == 2
+        assert len(results) == 2
+
+    def test_raises_timeout_error(self):
+        """Should raise GeocoderTimeoutError on timeout."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=httpx.TimeoutException("Timeout"))
+
+        client = AsyncOvertureGeocoder(http_client=mock_client)
+
+        with pytest.raises(GeocoderTimeoutError):
+            asyncio.run(client.search("test"))
+
+    def test_get_geometry_is_awaitable(self):
+        """Should run geometry lookups off the event loop."""
+        feature = {"type": "Feature", "id": "abc-123", "geometry": None}
+        fetch_threads = []
+
+        def fetch(gers_id):
+            fetch_threads.append(threading.get_ident())
+            return feature
+
+        client = AsyncOvertureGeocoder(http_client=MagicMock())
+
+        async def run():
+            return await client.get_geometry("abc-123"), threading.get_ident()
+
+        with patch.object(AsyncOvertureGeocoder, "_fetch_geometry", side_effect=fetch):
+            result, loop_thread = asyncio.run(run())
+
+        assert result == feature
+        assert fetch_threads and loop_thread not in fetch_threads
+
+    def test_get_geometry_many_is_awaitable(self):
+        """Should fetch many geometries without blocking the event loop."""
+        client = AsyncOvertureGeocoder(http_client=MagicMock())
+
+        def fetch(gers_id):
+            return {"type": "Feature", "id": gers_id, "geometry": None}
+
+        with patch.object(AsyncOvertureGeocoder, "_fetch_geometry", side_effect=fetch):
+            features = asyncio.run(client.get_geometry_many(["a", "b", "a"]))
+
+        assert list(features) == ["a", "b"]
+        assert features["b"]["id"] == "b"
+
+    def test_result_get_geometry_is_awaitable(self, mock_search_results):
+        """Should return an awaitable from results of the async client."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.json.return_value = mock_search_results
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        client = AsyncOvertureGeocoder(http_client=mock_client)
+
+        async def run():
+            results = await client.search("Boston")
+            return await results[0].get_geometry()
+
+        with patch.object(AsyncOvertureGeocoder, "_fetch_geometry", return_value=None):
+            assert asyncio.run(run()) is None
+
+    def test_raises_network_error(self):
+        """Should raise GeocoderNetworkError once retries are exhausted."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=httpx.ConnectError("Connection refused"))
+
+        client = AsyncOvertureGeocoder(
+            http_client=mock_client, retries=1, retry_delay=0.01
+        )
+
+        with pytest.raises(GeocoderNetworkError):
+            asyncio.run(client.search("test"))
+
+        assert mock_client.get.call_count == 2
+
+    def test_async_context_manager(self):
+        """Should close an owned client on exit."""
+
+        async def run():
+            async with AsyncOvertureGeocoder() as client:
+                assert isinstance(client, AsyncOvertureGeocoder)
+            return client
+
+        client = asyncio.run(run())
+        assert client._http.is_closed
+
+
 class TestGeocoderResult:
     """Tests for GeocoderResult dataclass."""
 
@@ -365,6 +569,83 @@ class TestGeocoderResult:
             result.get_geometry()
 
 
+class TestGeometryCache:
+    """Tests for geometry lookup caching."""
+
+    FEATURE = {
+        "type": "Feature",
+        "id": "abc-123",
+        "geometry": {"type": "Point", "coordinates": [-71.06, 42.36]},
+        "properties": {"id": "abc-123"},
+    }
+
+    def test_repeated_ids_are_fetched_once(self):
+        """Should serve repeated lookups from the cache."""
+        client = OvertureGeocoder(http_client=MagicMock())
+
+        with patch.object(
+            OvertureGeocoder, "_fetch_geometry", return_value=self.FEATURE
+        ) as mock_fetch:
+            first = client.get_geometry("abc-123")
+            second = client.get_geometry("abc-123")
+
+        assert mock_fetch.call_count == 1
+        assert first == second == self.FEATURE
+
+    def test_cached_results_are_shared(self):
+        """Should return the cached feature without copying it."""
+        client = OvertureGeocoder(http_client=MagicMock())
+
+        with patch.object(OvertureGeocoder, "_fetch_geometry", return_value=self.FEATURE):
+            assert client.get_geometry("abc-123") is client.get_geometry("abc-123")
+
+    def test_caches_missing_features(self):
+        """Should cache lookups that found nothing."""
+        client = OvertureGeocoder(http_client=MagicMock())
+
+        with patch.object(OvertureGeocoder, "_fetch_geometry", return_value=None) as mock_fetch:
+            assert client.get_geometry("missing") is None
+            assert client.get_geometry("missing") is None
+
+        assert mock_fetch.call_count == 1
+
+    def test_evicts_least_recently_used(self):
+        """Should keep at most GEOMETRY_CACHE_SIZE entries."""
+        client = OvertureGeocoder(http_client=MagicMock())
+
+        with patch("overture_geocoder.client.GEOMETRY_CACHE_SIZE", 2), \
+                patch.object(OvertureGeocoder, "_fetch_geometry", return_value=None) as mock_fetch:
+            client.get_geometry("a")
+            client.get_geometry("b")
+            client.get_geometry("a")
+            client.get_geometry("c")  # Evicts "b"
+            client.get_geometry("a")
+            client.get_geometry("b")
+
+        assert [c[0][0] for c in mock_fetch.call_args_list] == ["a", "b", "c", "b"]
+
+    def test_get_geometry_many(self):
+        """Should fetch each distinct ID once and key results by ID."""
+        client = OvertureGeocoder(http_client=MagicMock())
+
+        def fetch(gers_id):
+            return None if gers_id == "missing" else {**self.FEATURE, "id": gers_id}
+
+        with patch.object(OvertureGeocoder, "_fetch_geometry", side_effect=fetch) as mock_fetch:
+            features = client.get_geometry_many(["a", "b", "a", "missing"])
+
+        assert sorted(c[0][0] for c in mock_fetch.call_args_list) == ["a", "b", "missing"]
+        assert list(features) == ["a", "b", "missing"]
+        assert features["a"]["id"] == "a"
+        assert features["b"]["id"] == "b"
+        assert features["missing"] is None
+
+    def test_get_geometry_many_empty(self):
+        """Should return an empty dict for no IDs."""
+        client = OvertureGeocoder(http_client=MagicMock())
+        assert client.get_geometry_many([]) == {}
+
+
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
 
@@ -384,3 +665,21 @@ class TestConvenienceFunctions:
             results = geocode("123 Main St")
 
             assert len(results) == 2
+
+    def test_geocode_reuses_client(self, mock_search_results):
+        """Should reuse one HTTP client across geocode calls."""
+        mock_response = MagicMock()
+        mock_response.is_success = True
+        mock_response.json.return_value = mock_search_results
+
+        with patch("httpx.Client") as mock_client_class:
+            mock_instance = MagicMock()
+            mock_instance.get.return_value = mock_response
+            mock_client_class.return_value = mock_instance
+
+            geocode("123 Main St")
+            geocode("456 Elm St")
+
+            assert mock_client_class.call_count == 1
+            assert mock_instance.get.call_count == 2
+            mock_instance.close.assert_not_called()
@@ -2,25 +2,31 @@
 //!
 //! Provides a high-level interface for querying SQLite geocoding shards.
 
-use std::path::Path;
+use std::collections::HashSet;
+use std::path::{Path, PathBuf};
 
 use rusqlite::{Connection, OpenFlags};
 
 use crate::error::Result;
 use crate::query::{
-    calculate_boosted_score, prepare_fts_query, REVERSE_GEOCODE_SQL, SEARCH_DIVISIONS_SQL,
+    calculate_boosted_score, prepare_fts_query, REVERSE_GEOCODE_BBOX_SQL, REVERSE_GEOCODE_SQL,
+    SEARCH_DIVISIONS_BM25_SQL, SEARCH_DIVISIONS_SQL,
 };
 use crate::types::{
     DivisionRow, DivisionType, GeocoderQuery, GeocoderResult, HierarchyEntry, ReverseResult,
 };
 
-use std::collections::HashSet;
-
 /// A SQLite database connection for geocoding queries.
 pub struct Database {
     conn: Connection,
     /// Temp file path to clean up on drop (only used by `from_bytes`).
-    temp_file: Option<std::path::PathBuf>,
+    temp_file: Option<PathBuf>,
+    /// Whether the shard has the divisions_rtree index (reverse shards built
+    /// before it existed are queried by scanning bbox columns instead).
+    has_rtree: bool,
+    /// Whether divisions has the precomputed boost_offset column (forward
+    /// shards built before it existed get the population boost in Rust).
+    has_boost_offset: bool,
 }
 
 impl Drop for Database {
@@ -46,10 +52,7 @@ impl Database {
              PRAGMA temp_store = MEMORY;",
         )?;
 
-        Ok(Self {
-            conn,
-            temp_file: None,
-        })
+        Self::from_connection(conn, None)
     }
 
     /// Open a database from bytes.
@@ -74,10 +77,7 @@ impl Database {
              PRAGMA temp_store = MEMORY;",
         )?;
 
-        Ok(Self {
-            conn,
-            temp_file: Some(temp_path),
-        })
+        Self::from_connection(conn, Some(temp_path))
     }
 
     /// Open a database from bytes (WASM version).
@@ -104,10 +104,40 @@ impl Database {
         // Configure for read-only performance
         conn.execute_batch("PRAGMA temp_store = MEMORY;")?;
 
-        Ok(Self {
+        Self::from_connection(conn, None)
+    }
+
+    /// Wrap an open connection, detecting which optional shard tables exist.
+    fn from_connection(conn: Connection, temp_file: Option<PathBuf>) -> Result<Self> {
+        let mut db = Self {
             conn,
-            temp_file: None,
-        })
+            temp_file,
+            has_rtree: false,
+            has_boost_offset: false,
+        };
+        db.has_rtree = db.has_table("divisions_rtree")?;
+        db.has_boost_offset = db.has_column("divisions", "boost_offset")?;
+        Ok(db)
+    }
+
+    /// Check whether a table exists in the shard.
+    fn has_table(&self, name: &str) -> Result<bool> {
+        let count: i64 = self.conn.query_row(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = ?1",
+            [name],
+            |row| row.get(0),
+        )?;
+        Ok(count > 0)
+    }
+
+    /// Check whether a table has a column (false if the table is missing).
+    fn has_column(&self, table: &str, column: &str) -> Result<bool> {
+        let count: i64 = self.conn.query_row(
+            "SELECT COUNT(*) FROM pragma_table_info(?1) WHERE name = ?2",
+            [table, column],
+            |row| row.get(0),
+        )?;
+        Ok(count > 0)
     }
 
     /// Search for divisions matching the query.
@@ -122,7 +152,12 @@ impl Database {
             return Ok(vec![]);
         }
 
-        let mut stmt = self.conn.prepare_cached(SEARCH_DIVISIONS_SQL)?;
+        let sql = if self.has_boost_offset {
+            SEARCH_DIVISIONS_SQL
+        } else {
+            SEARCH_DIVISIONS_BM25_SQL
+        };
+        let mut stmt = self.conn.prepare_cached(sql)?;
 
         // Fetch more results than the final limit to allow bias to elevate
         // results that wouldn't otherwise make the cut.
@@ -130,8 +165,12 @@ impl Database {
 
         let rows = stmt.query_map([&fts_query, &fetch_limit.to_string()], |row| {
             let population: Option<i64> = row.get(10)?;
-            let bm25_score: f64 = row.get(13)?;
-            let boosted_score = calculate_boosted_score(bm25_score, population);
+            let score: f64 = row.get(13)?;
+            let boosted_score = if self.has_boost_offset {
+                score
+            } else {
+                calculate_boosted_score(score, population)
+            };
 
             Ok(DivisionRow {
                 rowid: row.get(0)?,
@@ -154,7 +193,8 @@ impl Database {
         // Collect rows, propagating any SQLite errors instead of silently dropping them
         let division_rows: Vec<DivisionRow> = rows.collect::<std::result::Result<Vec<_>, _>>()?;
 
-        // Convert to results and re-sort by boosted score (population boost affects ordering)
+        // Convert to results and re-sort by boosted score (a no-op when the
+        // shard's SQL already ranked by it; needed for bm25-only shards)
         let mut results: Vec<GeocoderResult> = division_rows
             .into_iter()
             .map(|row| row.into_result())
@@ -201,7 +241,12 @@ impl Database {
     ///
     /// This method expects a reverse geocoding shard (divisions_reverse table).
     pub fn reverse_geocode(&self, lat: f64, lon: f64) -> Result<Option<ReverseResult>> {
-        let mut stmt = self.conn.prepare_cached(REVERSE_GEOCODE_SQL)?;
+        let sql = if self.has_rtree {
+            REVERSE_GEOCODE_SQL
+        } else {
+            REVERSE_GEOCODE_BBOX_SQL
+        };
+        let mut stmt = self.conn.prepare_cached(sql)?;
 
         // Query for divisions whose bbox contains this point
         // lon is ?1, lat is ?2 (matching the SQL parameter order)
@@ -230,21 +275,16 @@ impl Database {
             return Ok(None);
         }
 
-        // Deduplicate by gers_id (for antimeridian-split divisions)
-        let mut seen_ids = HashSet::new();
-        let deduped: Vec<ReverseDivisionRow> = division_rows
-            .into_iter()
-            .filter(|row| seen_ids.insert(row.gers_id.clone()))
-            .collect();
-
         // First row is the most specific (smallest area) due to ORDER BY area ASC
-        let most_specific = &deduped[0];
+        let most_specific = &division_rows[0];
 
-        // Build hierarchy by collecting one of each subtype
+        // The query returns the smallest division of each subtype string.
+        // DivisionType::parse is case-insensitive, so still keep only the
+        // first (smallest) row per parsed type
         let mut hierarchy = Vec::new();
         let mut seen_subtypes = HashSet::new();
 
-        for row in &deduped {
+        for row in &division_rows {
             if let Some(div_type) = DivisionType::parse(&row.subtype) {
                 if seen_subtypes.insert(div_type) {
                     hierarchy.push(HierarchyEntry {
@@ -343,5 +383,236 @@ fn uuid_v4() -> String {
     format!("{:032x}", timestamp)
 }
 
-// Integration tests for Database are in crates/geocoder-core/tests/
+// Integration tests against built shards are in crates/geocoder-core/tests/
 // They require built shards: python scripts/build_shards.py --countries US
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// Point inside every fixture bbox except "far-locality".
+    const LAT: f64 = 0.5;
+    const LON: f64 = 0.5;
+
+    /// (gers_id, subtype, [xmin, ymin, xmax, ymax], area)
+    const REVERSE_ROWS: &[(&str, &str, [f64; 4], f64)] = &[
+        // Antimeridian-split country: two rows sharing a gers_id
+        ("country-a", "country", [-10.0, -10.0, 10.0, 10.0], 400.0),
+        ("country-a", "country", [-10.0, -10.0, 10.0, 10.0], 400.0),
+        ("region-large", "region", [-6.0, -6.0, 6.0, 6.0], 144.0),
+        ("region-small", "region", [-5.0, -5.0, 5.0, 5.0], 100.0),
+        ("locality", "locality", [-1.0, -1.0, 1.0, 1.0], 4.0),
+        ("far-locality", "locality", [5.0, 5.0, 6.0, 6.0], 1.0),
+    ];
+
+    /// Build an in-memory reverse shard, optionally with the R-Tree index.
+    fn reverse_db(rows: &[(&str, &str, [f64; 4], f64)], with_rtree: bool) -> Database {
+        let conn = Connection::open_in_memory().unwrap();
+        conn.execute_batch(
+            "CREATE TABLE divisions_reverse (
+                rowid INTEGER PRIMARY KEY,
+                gers_id TEXT NOT NULL,
+                subtype TEXT NOT NULL,
+                primary_name TEXT NOT NULL,
+                lat REAL NOT NULL,
+                lon REAL NOT NULL,
+                bbox_xmin REAL NOT NULL,
+                bbox_ymin REAL NOT NULL,
+                bbox_xmax REAL NOT NULL,
+                bbox_ymax REAL NOT NULL,
+                area REAL NOT NULL,
+                population INTEGER,
+                country TEXT,
+                region TEXT
+            );",
+        )
+        .unwrap();
+
+        for &(gers_id, subtype, bbox, area) in rows {
+            conn.execute(
+                "INSERT INTO divisions_reverse
+                    (gers_id, subtype, primary_name, lat, lon,
+                     bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax, area)
+                 VALUES (?1, ?2, ?1, ?3, ?4, ?5, ?6, ?7, ?8, ?9)",
+                rusqlite::params![
+                    gers_id,
+                    subtype,
+                    (bbox[1] + bbox[3]) / 2.0,
+                    (bbox[0] + bbox[2]) / 2.0,
+                    bbox[0],
+                    bbox[1],
+                    bbox[2],
+                    bbox[3],
+                    area,
+                ],
+            )
+            .unwrap();
+        }
+
+        if with_rtree {
+            conn.execute_batch(
+                "CREATE VIRTUAL TABLE divisions_rtree USING rtree(id, xmin, xmax, ymin, ymax);
+                 INSERT INTO divisions_rtree (id, xmin, xmax, ymin, ymax)
+                 SELECT rowid, bbox_xmin, bbox_xmax, bbox_ymin, bbox_ymax
+                 FROM divisions_reverse;",
+            )
+            .unwrap();
+        }
+
+        Database::from_connection(conn, None).unwrap()
+    }
+
+    fn hierarchy_ids(result: &ReverseResult) -> Vec<&str> {
+        result
+            .hierarchy
+            .iter()
+            .map(|h| h.gers_id.as_str())
+            .collect()
+    }
+
+    #[test]
+    fn test_reverse_one_entry_per_subtype() {
+        for with_rtree in [true, false] {
+            let db = reverse_db(REVERSE_ROWS, with_rtree);
+            let result = db.reverse_geocode(LAT, LON).unwrap().unwrap();
+
+            // Split country rows collapse; the smaller region wins
+            assert_eq!(
+                hierarchy_ids(&result),
+                vec!["locality", "region-small", "country-a"],
+                "with_rtree = {}",
+                with_rtree
+            );
+        }
+    }
+
+    #[test]
+    fn test_reverse_most_specific_is_smallest_containing() {
+        for with_rtree in [true, false] {
+            let db = reverse_db(REVERSE_ROWS, with_rtree);
+            let result = db.reverse_geocode(LAT, LON).unwrap().unwrap();
+
+            assert_eq!(result.gers_id, "locality", "with_rtree = {}", with_rtree);
+            assert_eq!(result.subtype, "locality");
+        }
+    }
+
+    #[test]
+    fn test_reverse_mixed_case_subtypes() {
+        let db = reverse_db(
+            &[
+                ("locality-upper", "Locality", [-2.0, -2.0, 2.0, 2.0], 16.0),
+                ("locality", "locality", [-1.0, -1.0, 1.0, 1.0], 4.0),
+            ],
+            true,
+        );
+        let result = db.reverse_geocode(LAT, LON).unwrap().unwrap();
+
+        assert_eq!(hierarchy_ids(&result), vec!["locality"]);
+    }
+
+    #[test]
+    fn test_reverse_no_match() {
+        let db = reverse_db(REVERSE_ROWS, true);
+        assert!(db.reverse_geocode(50.0, 50.0).unwrap().is_none());
+    }
+
+    /// (gers_id, population); every row has the same search text.
+    const SEARCH_ROWS: &[(&str, Option<i64>)] = &[
+        ("springfield-unknown", None),
+        ("springfield-small", Some(1_000)),
+        ("springfield-large", Some(150_000)),
+    ];
+
+    /// Build an in-memory forward shard, optionally with boost_offset
+    /// precomputed the way scripts/build_shards.py does.
+    fn search_db(with_boost_offset: bool) -> Database {
+        let conn = Connection::open_in_memory().unwrap();
+        conn.execute_batch(
+            "CREATE TABLE divisions (
+                rowid INTEGER PRIMARY KEY,
+                gers_id TEXT NOT NULL,
+                type TEXT NOT NULL,
+                primary_name TEXT NOT NULL,
+                lat REAL NOT NULL,
+                lon REAL NOT NULL,
+                bbox_xmin REAL NOT NULL,
+                bbox_ymin REAL NOT NULL,
+                bbox_xmax REAL NOT NULL,
+                bbox_ymax REAL NOT NULL,
+                population INTEGER,
+                country TEXT,
+                region TEXT,
+                search_text TEXT NOT NULL
+            );",
+        )
+        .unwrap();
+
+        if with_boost_offset {
+            conn.execute_batch(
+                "ALTER TABLE divisions ADD COLUMN boost_offset REAL NOT NULL DEFAULT 0;",
+            )
+            .unwrap();
+        }
+
+        for &(gers_id, population) in SEARCH_ROWS {
+            conn.execute(
+                "INSERT INTO divisions
+                    (gers_id, type, primary_name, lat, lon,
+                     bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax, population, search_text)
+                 VALUES (?1, 'locality', 'Springfield', 0, 0, 0, 0, 0, 0, ?2, 'springfield')",
+                rusqlite::params![gers_id, population],
+            )
+            .unwrap();
+        }
+
+        if with_boost_offset {
+            for &(gers_id, population) in SEARCH_ROWS {
+                conn.execute(
+                    "UPDATE divisions SET boost_offset = ?1 WHERE gers_id = ?2",
+                    rusqlite::params![calculate_boosted_score(0.0, population), gers_id],
+                )
+                .unwrap();
+            }
+        }
+
+        conn.execute_batch(
+            "CREATE VIRTUAL TABLE divisions_fts USING fts5(
+                search_text,
+                content=divisions,
+                content_rowid=rowid,
+                tokenize='porter unicode61 remove_diacritics 1',
+                prefix='2 3'
+            );
+            INSERT INTO divisions_fts(rowid, search_text)
+            SELECT rowid, search_text FROM divisions;",
+        )
+        .unwrap();
+
+        Database::from_connection(conn, None).unwrap()
+    }
+
+    #[test]
+    fn test_search_boost_same_on_both_schemas() {
+        let query = GeocoderQuery::new("springfield");
+        let precomputed = search_db(true).search(&query).unwrap();
+        let computed = search_db(false).search(&query).unwrap();
+
+        let ids = |results: &[GeocoderResult]| -> Vec<String> {
+            results.iter().map(|r| r.gers_id.clone()).collect()
+        };
+        assert_eq!(
+            ids(&precomputed),
+            vec![
+                "springfield-large",
+                "springfield-small",
+                "springfield-unknown"
+            ]
+        );
+        assert_eq!(ids(&precomputed), ids(&computed));
+
+        for (a, b) in precomputed.iter().zip(&computed) {
+            assert!((a.importance - b.importance).abs() < 1e-9);
+        }
+    }
+}
@@ -15,16 +15,45 @@ pub use merge::merge_results;
 /// Multiplier for the natural log of population in boosted score calculation.
 /// Higher values increase the ranking advantage of high-population places.
 /// With 2.0, a city with 1M population gets ~27.6 points of boost (ln(1M) * 2.0).
+/// Mirrored by `POPULATION_BOOST_MULTIPLIER` in scripts/build_shards.py.
 pub const POPULATION_BOOST_MULTIPLIER: f64 = 2.0;
 
 /// Penalty applied to places with no population data.
 /// This gives a slight advantage to places with known population over unknowns.
 /// Set to match the boost a place with population=1 would receive (ln(2) * 2.0 ≈ 1.4).
+/// Mirrored by `MISSING_POPULATION_PENALTY` in scripts/build_shards.py.
 pub const MISSING_POPULATION_PENALTY: f64 = 2.0;
 
 /// SQL query for searching divisions.
-/// Note: BM25 scoring and population boost are computed in Rust for portability.
+/// Ranks by BM25 plus the population boost precomputed at build time
+/// (divisions.boost_offset), so the LIMIT applies to the boosted ranking.
 pub const SEARCH_DIVISIONS_SQL: &str = r#"
+    SELECT
+        d.rowid,
+        d.gers_id,
+        d.type,
+        d.primary_name,
+        d.lat,
+        d.lon,
+        d.bbox_xmin,
+        d.bbox_ymin,
+        d.bbox_xmax,
+        d.bbox_ymax,
+        d.population,
+        d.country,
+        d.region,
+        bm25(divisions_fts) + d.boost_offset as boosted_score
+    FROM divisions_fts
+    JOIN divisions d ON divisions_fts.rowid = d.rowid
+    WHERE divisions_fts MATCH ?1
+    ORDER BY boosted_score
+    LIMIT ?2
+"#;
+
+/// SQL query for searching divisions on shards without divisions.boost_offset.
+/// Ranks by BM25 alone; the population boost is applied in Rust with
+/// `calculate_boosted_score`.
+pub const SEARCH_DIVISIONS_BM25_SQL: &str = r#"
     SELECT
         d.rowid,
         d.gers_id,
@@ -48,7 +77,8 @@ pub const SEARCH_DIVISIONS_SQL: &str = r#"
 "#;
 
 /// Calculate boosted score from BM25 and population.
-/// Lower score = better match.
+/// Lower score = better match. Shard builds precompute the population term
+/// as divisions.boost_offset (i.e. `calculate_boosted_score(0.0, population)`).
 pub fn calculate_boosted_score(bm25_score: f64, population: Option<i64>) -> f64 {
     match population {
         Some(pop) if pop > 0 => {
@@ -59,7 +89,38 @@ pub fn calculate_boosted_score(bm25_score: f64, population: Option<i64>) -> f64
 }
 
 /// SQL query for reverse geocoding (bbox containment).
+/// Candidates come from the divisions_rtree R-Tree index; the R-Tree stores
+/// 32-bit float bounds, so the exact bbox check is repeated on the table row.
+/// Only the smallest containing division of each subtype is returned, which
+/// also collapses antimeridian-split rows sharing a gers_id.
 pub const REVERSE_GEOCODE_SQL: &str = r#"
+    WITH hits AS (
+        SELECT
+            d.gers_id,
+            d.subtype,
+            d.primary_name,
+            d.lat,
+            d.lon,
+            d.bbox_xmin,
+            d.bbox_ymin,
+            d.bbox_xmax,
+            d.bbox_ymax,
+            d.area,
+            d.population,
+            d.country,
+            d.region,
+            ROW_NUMBER() OVER (PARTITION BY d.subtype ORDER BY d.area ASC) AS rn
+        FROM divisions_rtree r
+        JOIN divisions_reverse d ON d.rowid = r.id
+        WHERE r.xmin <= ?1
+          AND r.xmax >= ?1
+          AND r.ymin <= ?2
+          AND r.ymax >= ?2
+          AND d.bbox_xmin <= ?1
+          AND d.bbox_xmax >= ?1
+          AND d.bbox_ymin <= ?2
+          AND d.bbox_ymax >= ?2
+    )
     SELECT
         gers_id,
         subtype,
@@ -74,11 +135,68 @@ pub const REVERSE_GEOCODE_SQL: &str = r#"
         population,
         country,
         region
-    FROM divisions_reverse
-    WHERE bbox_xmin <= ?1
-      AND bbox_xmax >= ?1
-      AND bbox_ymin <= ?2
-      AND bbox_ymax >= ?2
+    FROM hits
+    WHERE rn = 1
     ORDER BY area ASC
-    LIMIT 50
 "#;
+
+/// SQL query for reverse geocoding on shards without the divisions_rtree index.
+/// Same results as `REVERSE_GEOCODE_SQL`, filtering on the bbox columns directly.
+pub const REVERSE_GEOCODE_BBOX_SQL: &str = r#"
+    WITH hits AS (
+        SELECT
+            d.gers_id,
+            d.subtype,
+            d.primary_name,
+            d.lat,
+            d.lon,
+            d.bbox_xmin,
+            d.bbox_ymin,
+            d.bbox_xmax,
+            d.bbox_ymax,
+            d.area,
+            d.population,
+            d.country,
+            d.region,
+            ROW_NUMBER() OVER (PARTITION BY d.subtype ORDER BY d.area ASC) AS rn
+        FROM divisions_reverse d
+        WHERE d.bbox_xmin <= ?1
+          AND d.bbox_xmax >= ?1
+          AND d.bbox_ymin <= ?2
+          AND d.bbox_ymax >= ?2
+    )
+    SELECT
+        gers_id,
+        subtype,
+        primary_name,
+        lat,
+        lon,
+        bbox_xmin,
+        bbox_ymin,
+        bbox_xmax,
+        bbox_ymax,
+        area,
+        population,
+        country,
+        region
+    FROM hits
+    WHERE rn = 1
+    ORDER BY area ASC
+"#;
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_boosted_score_with_population() {
+        let score = calculate_boosted_score(-1.0, Some(999));
+        assert!((score - (-1.0 - 1000f64.ln() * 2.0)).abs() < 1e-9);
+    }
+
+    #[test]
+    fn test_boosted_score_missing_population() {
+        assert_eq!(calculate_boosted_score(-1.0, None), -3.0);
+        assert_eq!(calculate_boosted_score(-1.0, Some(0)), -3.0);
+    }
+}
@@ -91,9 +91,46 @@ DIVISIONS_REVERSE_PARQUET = EXPORTS_DIR / "divisions-reverse.parquet"
 # HEAD shard includes countries, regions, and localities with pop >= threshold
 DEFAULT_HEAD_THRESHOLD = 100_000
 
-# Antimeridian-crossing divisions have bboxes spanning > 180 degrees
-# DuckDB normalizes these to [-180, 180] so we detect by width
-ANTIMERIDIAN_WIDTH_THRESHOLD = 180.0
+# SQLite settings for post-load shard work (FTS/index builds, VACUUM).
+# Shards are rebuilt from scratch on failure, so durability is traded for speed.
+# None of these persist in the file, which stays in rollback-journal mode.
+BUILD_PRAGMAS = """
+    PRAGMA journal_mode=OFF;
+    PRAGMA synchronous=OFF;
+    PRAGMA locking_mode=EXCLUSIVE;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-512000;
+"""
+
+# Search ranking boost, precomputed per row so queries only add it to bm25().
+# Must match calculate_boosted_score in crates/geocoder-core/src/query/mod.rs,
+# which still applies it for shards built without boost_offset.
+# Lower score = better match. With a multiplier of 2.0, a city with 1M
+# population gets ~27.6 points of boost (ln(1M) * 2.0). Places with no
+# population get a flat 2.0, about what population=1 would receive.
+POPULATION_BOOST_MULTIPLIER = 2.0
+MISSING_POPULATION_PENALTY = 2.0
+BOOST_OFFSET_SQL = f"""
+    CASE WHEN population > 0
+        THEN -LN(population + 1) * {POPULATION_BOOST_MULTIPLIER}
+        ELSE -{MISSING_POPULATION_PENALTY}
+    END
+"""
+
+# Column order shared by the forward shard SELECTs and the divisions table
+DIVISIONS_COLUMNS = [
+    "gers_id", "version", "type", "primary_name", "lat", "lon",
+    "bbox_xmin", "bbox_ymin", "bbox_xmax", "bbox_ymax",
+    "population", "country", "region", "search_text", "boost_offset",
+]
+
+# Column order shared by the reverse shard SELECTs and the divisions_reverse table
+DIVISIONS_REVERSE_COLUMNS = [
+    "gers_id", "subtype", "primary_name", "lat", "lon",
+    "bbox_xmin", "bbox_ymin", "bbox_xmax", "bbox_ymax",
+    "area", "population", "country", "region",
+]
 
 
 def get_version() -> str:
@@ -138,7 +175,65 @@ def get_regions_for_country(parquet_path: Path, country_code: str) -> list[tuple
     """).fetchall()
     con.close()
 
-    return [(r[0], r[1]) for r in result]
+    return result
+
+
+def connect_for_build(path: Path) -> sqlite3.Connection:
+    """Open a shard for post-load work with BUILD_PRAGMAS applied."""
+    db = sqlite3.connect(path)
+    db.executescript(BUILD_PRAGMAS)
+    return db
+
+
+def load_shard_rows(
+    output_path: Path,
+    table: str,
+    columns: list[str],
+    select_sql: str,
+) -> tuple[int, list[float]]:
+    """
+    Copy query results into a SQLite shard table using DuckDB's sqlite extension.
+
+    Rows are inserted natively by DuckDB without passing through Python.
+    The shard schema must already exist with the destination table empty, and
+    no other connection may hold it open.
+
+    Args:
+        output_path: Path to the SQLite shard
+        table: Destination table name (must have bbox_* columns)
+        columns: Destination column names, in select_sql column order
+        select_sql: DuckDB query producing the rows
+
+    Returns:
+        Tuple of (record_count, bbox) where bbox is [min_lon, min_lat, max_lon, max_lat]
+    """
+    shard_path = str(output_path.resolve()).replace("'", "''")
+
+    con = duckdb.connect()
+    con.execute("INSTALL sqlite; LOAD sqlite;")
+    con.execute(f"ATTACH '{shard_path}' AS shard (TYPE sqlite)")
+
+    con.execute(f"""
+        INSERT INTO shard.{table} ({', '.join(columns)})
+        {select_sql}
+    """)
+
+    # Aggregate over the loaded table so the source is only scanned once.
+    # Empty shards keep the inverted bbox, matching an extent that covers nothing
+    count, *bbox = con.execute(f"""
+        SELECT
+            COUNT(*),
+            COALESCE(MIN(bbox_xmin), 180.0),
+            COALESCE(MIN(bbox_ymin), 90.0),
+            COALESCE(MAX(bbox_xmax), -180.0),
+            COALESCE(MAX(bbox_ymax), -90.0)
+        FROM shard.{table}
+    """).fetchone()
+
+    con.execute("DETACH shard")
+    con.close()
+
+    return count, bbox
 
 
 def build_region_shard(
@@ -171,10 +266,9 @@ def build_region_shard(
     if output_path.exists():
         output_path.unlink()
 
-    con = duckdb.connect()
     db = sqlite3.connect(output_path)
-
     build_shard_schema(db)
+    db.close()
 
     # Handle fallback region (null region records)
     is_fallback = region_code.endswith(f"-{FALLBACK_REGION_SUFFIX}")
@@ -183,8 +277,8 @@ def build_region_shard(
     else:
         region_filter = f"region = '{region_code}'"
 
-    # Query divisions for this region
-    cursor = con.execute(f"""
+    # Copy divisions for this region straight from parquet into the shard
+    count, bbox = load_shard_rows(output_path, "divisions", DIVISIONS_COLUMNS, f"""
         SELECT
             gers_id,
             version,
@@ -199,36 +293,14 @@ def build_region_shard(
             population,
             country,
             region,
-            search_text
+            search_text,
+            {BOOST_OFFSET_SQL} as boost_offset
         FROM read_parquet('{parquet_str}')
         WHERE country = '{country_code}' AND {region_filter}
     """)
 
-    # Stream rows in chunks
-    count = 0
-    bbox = [180.0, 90.0, -180.0, -90.0]  # [min_lon, min_lat, max_lon, max_lat]
-    FETCH_SIZE = 50000
-
-    while True:
-        rows = cursor.fetchmany(FETCH_SIZE)
-        if not rows:
-            break
-
-        # Update bbox from this batch
-        for row in rows:
-            bbox[0] = min(bbox[0], row[6])  # bbox_xmin
-            bbox[1] = min(bbox[1], row[7])  # bbox_ymin
-            bbox[2] = max(bbox[2], row[8])  # bbox_xmax
-            bbox[3] = max(bbox[3], row[9])  # bbox_ymax
-
-        db.executemany("""
-            INSERT INTO divisions (
-                gers_id, version, type, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                population, country, region, search_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
-        count += len(rows)
+    db = connect_for_build(output_path)
+    build_shard_indexes(db)
 
     # Store metadata
     db.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)", (version,))
@@ -243,7 +315,6 @@ def build_region_shard(
     db.commit()
     db.execute("VACUUM")
     db.close()
-    con.close()
 
     return {
         "country": country_code,
@@ -255,11 +326,10 @@ def build_region_shard(
 
 
 def build_shard_schema(db: sqlite3.Connection):
-    """Create the shard schema with FTS5."""
+    """Create the shard tables (indexes are added after loading by build_shard_indexes)."""
     db.executescript("""
-        PRAGMA journal_mode=DELETE;
-        PRAGMA synchronous=NORMAL;
-        PRAGMA cache_size=-64000;
+        -- Must be set before the first table is created
+        PRAGMA page_size=8192;
 
         CREATE TABLE IF NOT EXISTS metadata (
             key TEXT PRIMARY KEY,
@@ -268,7 +338,7 @@ def build_shard_schema(db: sqlite3.Connection):
 
         CREATE TABLE IF NOT EXISTS divisions (
             rowid INTEGER PRIMARY KEY,
-            gers_id TEXT NOT NULL UNIQUE,
+            gers_id TEXT NOT NULL,
             version INTEGER NOT NULL DEFAULT 0,
             type TEXT NOT NULL,
             primary_name TEXT NOT NULL,
@@ -281,8 +351,22 @@ def build_shard_schema(db: sqlite3.Connection):
             population INTEGER,
             country TEXT,
             region TEXT,
-            search_text TEXT NOT NULL
+            search_text TEXT NOT NULL,
+            boost_offset REAL NOT NULL
         );
+    """)
+
+
+def build_shard_indexes(db: sqlite3.Connection):
+    """
+    Create the gers_id index and FTS5 index over loaded divisions.
+
+    Runs after the bulk load so each index is built in one pass rather than
+    maintained row by row. Shards are read-only once built, so no FTS sync
+    triggers are created.
+    """
+    db.executescript("""
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_gers_id ON divisions(gers_id);
 
         CREATE VIRTUAL TABLE IF NOT EXISTS divisions_fts USING fts5(
             search_text,
@@ -292,22 +376,8 @@ def build_shard_schema(db: sqlite3.Connection):
             prefix='2 3'
         );
 
-        CREATE TRIGGER IF NOT EXISTS divisions_ai AFTER INSERT ON divisions BEGIN
-            INSERT INTO divisions_fts(rowid, search_text)
-            VALUES (new.rowid, new.search_text);
-        END;
-
-        CREATE TRIGGER IF NOT EXISTS divisions_ad AFTER DELETE ON divisions BEGIN
-            INSERT INTO divisions_fts(divisions_fts, rowid, search_text)
-            VALUES ('delete', old.rowid, old.search_text);
-        END;
-
-        CREATE TRIGGER IF NOT EXISTS divisions_au AFTER UPDATE ON divisions BEGIN
-            INSERT INTO divisions_fts(divisions_fts, rowid, search_text)
-            VALUES ('delete', old.rowid, old.search_text);
-            INSERT INTO divisions_fts(rowid, search_text)
-            VALUES (new.rowid, new.search_text);
-        END;
+        INSERT INTO divisions_fts(rowid, search_text)
+        SELECT rowid, search_text FROM divisions;
     """)
 
 
@@ -327,14 +397,13 @@ def build_country_shard(
     if output_path.exists():
         output_path.unlink()
 
-    con = duckdb.connect()
     db = sqlite3.connect(output_path)
-
     build_shard_schema(db)
+    db.close()
 
-    # Query divisions for this country
+    # Copy divisions for this country straight from parquet into the shard
     # Note: DuckDB requires file paths in the query string, but country_code is validated above
-    cursor = con.execute(f"""
+    count, bbox = load_shard_rows(output_path, "divisions", DIVISIONS_COLUMNS, f"""
         SELECT
             gers_id,
             version,
@@ -349,36 +418,14 @@ def build_country_shard(
             population,
             country,
             region,
-            search_text
+            search_text,
+            {BOOST_OFFSET_SQL} as boost_offset
         FROM read_parquet('{parquet_str}')
         WHERE country = '{country_code}'
     """)
 
-    # Stream rows in chunks to avoid loading entire dataset into memory
-    count = 0
-    bbox = [180.0, 90.0, -180.0, -90.0]  # [min_lon, min_lat, max_lon, max_lat]
-    FETCH_SIZE = 50000
-
-    while True:
-        rows = cursor.fetchmany(FETCH_SIZE)
-        if not rows:
-            break
-
-        # Update bbox from this batch
-        for row in rows:
-            bbox[0] = min(bbox[0], row[6])  # bbox_xmin
-            bbox[1] = min(bbox[1], row[7])  # bbox_ymin
-            bbox[2] = max(bbox[2], row[8])  # bbox_xmax
-            bbox[3] = max(bbox[3], row[9])  # bbox_ymax
-
-        db.executemany("""
-            INSERT INTO divisions (
-                gers_id, version, type, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                population, country, region, search_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
-        count += len(rows)
+    db = connect_for_build(output_path)
+    build_shard_indexes(db)
 
     # Store metadata
     db.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)", (version,))
@@ -392,7 +439,6 @@ def build_country_shard(
     db.commit()
     db.execute("VACUUM")
     db.close()
-    con.close()
 
     return {
         "country": country_code,
@@ -418,10 +464,9 @@ def build_head_shard(
     if output_path.exists():
         output_path.unlink()
 
-    con = duckdb.connect()
     db = sqlite3.connect(output_path)
-
     build_shard_schema(db)
+    db.close()
 
     # HEAD shard query: countries, regions, and high-population localities
     # We need to query Overture directly for countries/regions since they're
@@ -430,7 +475,7 @@ def build_head_shard(
     # For now, just include high-population localities from the existing parquet
     # TODO: Add countries and regions from a separate query
     # Note: population_threshold is validated as integer above
-    cursor = con.execute(f"""
+    count, _ = load_shard_rows(output_path, "divisions", DIVISIONS_COLUMNS, f"""
         SELECT
             gers_id,
             version,
@@ -445,29 +490,15 @@ def build_head_shard(
             population,
             country,
             region,
-            search_text
+            search_text,
+            {BOOST_OFFSET_SQL} as boost_offset
         FROM read_parquet('{parquet_str}')
         WHERE population >= {population_threshold}
            OR subtype IN ('county')
     """)
 
-    # Stream rows in chunks to avoid loading entire dataset into memory
-    count = 0
-    FETCH_SIZE = 50000
-
-    while True:
-        rows = cursor.fetchmany(FETCH_SIZE)
-        if not rows:
-            break
-
-        db.executemany("""
-            INSERT INTO divisions (
-                gers_id, version, type, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                population, country, region, search_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, rows)
-        count += len(rows)
+    db = connect_for_build(output_path)
+    build_shard_indexes(db)
 
     # Store metadata
     db.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)", (version,))
@@ -483,7 +514,6 @@ def build_head_shard(
     db.commit()
     db.execute("VACUUM")
     db.close()
-    con.close()
 
     return {
         "country": "HEAD",
@@ -494,11 +524,10 @@ def build_head_shard(
 
 
 def build_reverse_shard_schema(db: sqlite3.Connection):
-    """Create the reverse geocoding shard schema (no FTS, bbox-indexed)."""
+    """Create the reverse geocoding shard tables (indexes are added by build_reverse_shard_indexes)."""
     db.executescript("""
-        PRAGMA journal_mode=DELETE;
-        PRAGMA synchronous=NORMAL;
-        PRAGMA cache_size=-64000;
+        -- Must be set before the first table is created
+        PRAGMA page_size=8192;
 
         CREATE TABLE IF NOT EXISTS metadata (
             key TEXT PRIMARY KEY,
@@ -522,50 +551,31 @@ def build_reverse_shard_schema(db: sqlite3.Connection):
             country TEXT,
             region TEXT
         );
-
-        -- Bbox index for reverse geocoding queries
-        CREATE INDEX IF NOT EXISTS idx_bbox ON divisions_reverse(
-            bbox_xmin, bbox_xmax, bbox_ymin, bbox_ymax
-        );
-
-        -- Index for deduplication of antimeridian splits
-        CREATE INDEX IF NOT EXISTS idx_gers_id ON divisions_reverse(gers_id);
-
-        -- Area index for sorting by specificity
-        CREATE INDEX IF NOT EXISTS idx_area ON divisions_reverse(area);
     """)
 
 
-def maybe_split_antimeridian(row: tuple) -> list[tuple]:
+def build_reverse_shard_indexes(db: sqlite3.Connection):
     """
-    Split divisions that cross the antimeridian into two rows.
+    Create the bbox R-Tree and secondary indexes over loaded divisions_reverse.
 
-    DuckDB normalizes antimeridian-crossing bboxes to span [-180, 180].
-    We detect these by checking if the bbox width exceeds 180 degrees.
-
-    Returns 1 or 2 rows depending on whether splitting is needed.
+    Point-in-bbox lookups need range predicates on all four bbox columns,
+    which a composite B-tree index can only prune on the first of.
     """
-    # Row structure from parquet query:
-    # (gers_id, subtype, primary_name, lat, lon, bbox_xmin, bbox_ymin,
-    #  bbox_xmax, bbox_ymax, area, population, country, region)
-    bbox_xmin = row[5]
-    bbox_xmax = row[8]
-    width = bbox_xmax - bbox_xmin
+    db.executescript("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS divisions_rtree USING rtree(
+            id, xmin, xmax, ymin, ymax
+        );
 
-    if width > ANTIMERIDIAN_WIDTH_THRESHOLD:
-        # This division likely crosses the antimeridian
-        # Split into eastern (bbox_xmin to 180) and western (-180 to bbox_xmax) halves
+        INSERT INTO divisions_rtree (id, xmin, xmax, ymin, ymax)
+        SELECT rowid, bbox_xmin, bbox_xmax, bbox_ymin, bbox_ymax
+        FROM divisions_reverse;
 
-        # Eastern half: from original xmin to +180
-        eastern = row[:5] + (row[5], row[6], 180.0, row[8]) + row[9:]
-        # Actually we need to reconsider: if the bbox is already [-180, 180],
-        # splitting doesn't help because we don't know the actual split point.
-        #
-        # For now, just pass through and let area ranking handle it.
-        # A proper fix would require the original polygon geometry.
-        return [row]
+        -- Index for deduplication of antimeridian splits
+        CREATE INDEX IF NOT EXISTS idx_gers_id ON divisions_reverse(gers_id);
 
-    return [row]
+        -- Area index for sorting by specificity
+        CREATE INDEX IF NOT EXISTS idx_area ON divisions_reverse(area);
+    """)
 
 
 def build_reverse_country_shard(
@@ -584,13 +594,12 @@ def build_reverse_country_shard(
     if output_path.exists():
         output_path.unlink()
 
-    con = duckdb.connect()
     db = sqlite3.connect(output_path)
-
     build_reverse_shard_schema(db)
+    db.close()
 
-    # Query reverse geocoding data for this country
-    cursor = con.execute(f"""
+    # Copy reverse geocoding data for this country straight into the shard
+    count, bbox = load_shard_rows(output_path, "divisions_reverse", DIVISIONS_REVERSE_COLUMNS, f"""
         SELECT
             gers_id,
             subtype,
@@ -609,34 +618,8 @@ def build_reverse_country_shard(
         WHERE country = '{country_code}'
     """)
 
-    count = 0
-    bbox = [180.0, 90.0, -180.0, -90.0]
-    FETCH_SIZE = 50000
-
-    while True:
-        rows = cursor.fetchmany(FETCH_SIZE)
-        if not rows:
-            break
-
-        # Process rows (potential antimeridian splitting)
-        processed_rows = []
-        for row in rows:
-            for split_row in maybe_split_antimeridian(row):
-                processed_rows.append(split_row)
-                # Update bbox
-                bbox[0] = min(bbox[0], split_row[5])  # bbox_xmin
-                bbox[1] = min(bbox[1], split_row[6])  # bbox_ymin
-                bbox[2] = max(bbox[2], split_row[7])  # bbox_xmax
-                bbox[3] = max(bbox[3], split_row[8])  # bbox_ymax
-
-        db.executemany("""
-            INSERT INTO divisions_reverse (
-                gers_id, subtype, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                area, population, country, region
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, processed_rows)
-        count += len(processed_rows)
+    db = connect_for_build(output_path)
+    build_reverse_shard_indexes(db)
 
     # Store metadata
     db.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)", (version,))
@@ -649,7 +632,6 @@ def build_reverse_country_shard(
     db.commit()
     db.execute("VACUUM")
     db.close()
-    con.close()
 
     return {
         "country": country_code,
@@ -674,13 +656,12 @@ def build_reverse_head_shard(
     if output_path.exists():
         output_path.unlink()
 
-    con = duckdb.connect()
     db = sqlite3.connect(output_path)
-
     build_reverse_shard_schema(db)
+    db.close()
 
     # HEAD shard: countries, regions, counties, and high-population localities
-    cursor = con.execute(f"""
+    count, _ = load_shard_rows(output_path, "divisions_reverse", DIVISIONS_REVERSE_COLUMNS, f"""
         SELECT
             gers_id,
             subtype,
@@ -700,27 +681,8 @@ def build_reverse_head_shard(
            OR (population IS NOT NULL AND population >= {population_threshold})
     """)
 
-    count = 0
-    FETCH_SIZE = 50000
-
-    while True:
-        rows = cursor.fetchmany(FETCH_SIZE)
-        if not rows:
-            break
-
-        processed_rows = []
-        for row in rows:
-            for split_row in maybe_split_antimeridian(row):
-                processed_rows.append(split_row)
-
-        db.executemany("""
-            INSERT INTO divisions_reverse (
-                gers_id, subtype, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                area, population, country, region
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, processed_rows)
-        count += len(processed_rows)
+    db = connect_for_build(output_path)
+    build_reverse_shard_indexes(db)
 
     # Store metadata
     db.execute("INSERT OR REPLACE INTO metadata VALUES ('version', ?)", (version,))
@@ -734,7 +696,6 @@ def build_reverse_head_shard(
     db.commit()
     db.execute("VACUUM")
     db.close()
-    con.close()
 
     return {
         "country": "HEAD",
@@ -756,10 +717,10 @@ def hash_file(path: Path) -> str:
 def generate_stac_item(
     shard_id: str,
     shard_info: dict,
-    shard_path: Path,
+    sha256: str,
     version: str,
 ) -> dict:
-    """Generate STAC Item for a shard."""
+    """Generate STAC Item for a shard, given its precomputed SHA256 hash."""
     bbox = shard_info["bbox"]
 
     return {
@@ -782,7 +743,7 @@ def generate_stac_item(
             "datetime": datetime.now(timezone.utc).isoformat(),
             "record_count": shard_info["record_count"],
             "size_bytes": shard_info["size_bytes"],
-            "sha256": hash_file(shard_path),
+            "sha256": sha256,
         },
         "assets": {
             "data": {
@@ -1005,8 +966,7 @@ def build_forward_shards(args, version: str, version_dir: Path) -> dict:
     # Generate STAC items (for backward compatibility)
     print("Generating STAC catalog...")
     for shard_id, info in shard_infos.items():
-        shard_path = shards_subdir / f"{shard_id}.db"
-        item = generate_stac_item(shard_id, info, shard_path, version)
+        item = generate_stac_item(shard_id, info, shard_hashes[shard_id], version)
         write_json(items_subdir / f"{shard_id}.json", item)
 
     # Generate collection with embedded items and region_sharded metadata
@@ -1086,8 +1046,7 @@ def build_reverse_shards(args, version: str, version_dir: Path) -> dict:
     # Generate STAC items for reverse shards (for backward compatibility)
     print("Generating reverse STAC catalog...")
     for shard_id, info in shard_infos.items():
-        shard_path = reverse_subdir / f"{shard_id}.db"
-        item = generate_stac_item(shard_id, info, shard_path, version)
+        item = generate_stac_item(shard_id, info, shard_hashes[shard_id], version)
         # Update asset href for reverse
         item["assets"]["data"]["href"] = f"./reverse/{shard_id}.db"
         item["assets"]["data"]["title"] = f"{shard_id} reverse geocoding shard"
@@ -295,7 +295,24 @@ def create_divisions_fixture(output_dir: Path) -> bool:
         )
     """)
 
-    # Create triggers for FTS sync
+    # Insert divisions
+    for div in DIVISIONS_DATA:
+        db.execute("""
+            INSERT INTO divisions (
+                gers_id, type, primary_name, lat, lon,
+                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
+                population, country, region, search_text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            div["gers_id"], div["type"], div["primary_name"],
+            div["lat"], div["lon"],
+            div["bbox_xmin"], div["bbox_ymin"], div["bbox_xmax"], div["bbox_ymax"],
+            div["population"], div["country"], div["region"], div["search_text"]
+        ))
+
+    # Populate FTS in one pass, then add triggers to keep it in sync
+    db.execute("INSERT INTO divisions_fts(rowid, search_text) SELECT rowid, search_text FROM divisions")
+
     db.execute("""
         CREATE TRIGGER divisions_ai AFTER INSERT ON divisions BEGIN
             INSERT INTO divisions_fts(rowid, search_text)
@@ -317,21 +334,6 @@ def create_divisions_fixture(output_dir: Path) -> bool:
         END
     """)
 
-    # Insert divisions
-    for div in DIVISIONS_DATA:
-        db.execute("""
-            INSERT INTO divisions (
-                gers_id, type, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                population, country, region, search_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            div["gers_id"], div["type"], div["primary_name"],
-            div["lat"], div["lon"],
-            div["bbox_xmin"], div["bbox_ymin"], div["bbox_xmax"], div["bbox_ymax"],
-            div["population"], div["country"], div["region"], div["search_text"]
-        ))
-
     # Create indexes
     db.execute("CREATE INDEX idx_gers ON divisions(gers_id)")
     db.execute("CREATE INDEX idx_type ON divisions(type)")
@@ -390,7 +392,26 @@ def create_features_fixture(output_dir: Path) -> bool:
         )
     """)
 
-    # Create triggers for FTS sync
+    # Insert addresses
+    for addr in ADDRESSES_DATA:
+        # Use address coordinates for bbox (point)
+        lat, lon = addr["lat"], addr["lon"]
+        db.execute("""
+            INSERT INTO features (
+                gers_id, type, primary_name, lat, lon,
+                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
+                population, city, state, postcode, search_text
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            addr["gers_id"], addr["type"], addr["primary_name"],
+            lat, lon,
+            lon, lat, lon, lat,  # Point bbox
+            None, addr["city"], addr["state"], addr["postcode"], addr["search_text"]
+        ))
+
+    # Populate FTS in one pass, then add triggers to keep it in sync
+    db.execute("INSERT INTO features_fts(rowid, search_text) SELECT rowid, search_text FROM features")
+
     db.execute("""
         CREATE TRIGGER features_ai AFTER INSERT ON features BEGIN
             INSERT INTO features_fts(rowid, search_text)
@@ -412,23 +433,6 @@ def create_features_fixture(output_dir: Path) -> bool:
         END
     """)
 
-    # Insert addresses
-    for addr in ADDRESSES_DATA:
-        # Use address coordinates for bbox (point)
-        lat, lon = addr["lat"], addr["lon"]
-        db.execute("""
-            INSERT INTO features (
-                gers_id, type, primary_name, lat, lon,
-                bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax,
-                population, city, state, postcode, search_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            addr["gers_id"], addr["type"], addr["primary_name"],
-            lat, lon,
-            lon, lat, lon, lat,  # Point bbox
-            None, addr["city"], addr["state"], addr["postcode"], addr["search_text"]
-        ))
-
     # Create indexes
     db.execute("CREATE INDEX idx_gers ON features(gers_id)")
     db.execute("CREATE INDEX idx_type ON features(type)")
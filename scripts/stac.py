@@ -10,14 +10,19 @@ Usage:
 import argparse
 import json
 import sys
+from functools import lru_cache
 from urllib.request import urlopen
 
 STAC_ROOT = "https://stac.overturemaps.org/catalog.json"
 
+# Seconds to wait on the STAC server before giving up
+STAC_TIMEOUT = 10
 
+
+@lru_cache(maxsize=8)
 def get_catalog(url: str) -> dict:
-    """Fetch and parse a STAC catalog."""
-    with urlopen(url) as response:
+    """Fetch and parse a STAC catalog (cached per URL; treat as read-only)."""
+    with urlopen(url, timeout=STAC_TIMEOUT) as response:
         return json.load(response)
 
 
@@ -1,14 +1,23 @@
 """Tests for build_shards.py functions."""
 
+import math
+import re
+import sqlite3
 import sys
 from pathlib import Path
 
+import duckdb
 import pytest
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from build_shards import (
+    BOOST_OFFSET_SQL,
+    MISSING_POPULATION_PENALTY,
+    POPULATION_BOOST_MULTIPLIER,
+    build_country_shard,
+    build_reverse_country_shard,
     validate_country_code,
     validate_region_code,
     validate_population_threshold,
@@ -77,3 +86,130 @@ class TestConstants:
 
     def test_fallback_region_suffix(self):
         assert FALLBACK_REGION_SUFFIX == "XX"
+
+
+RUST_QUERY_MOD = Path(__file__).parent.parent / "crates/geocoder-core/src/query/mod.rs"
+
+
+def rust_constant(name: str) -> float:
+    """Read an f64 constant from geocoder-core's query module."""
+    match = re.search(rf"pub const {name}: f64 = ([0-9.]+);", RUST_QUERY_MOD.read_text())
+    return float(match.group(1))
+
+
+class TestBoostOffset:
+    """boost_offset must equal calculate_boosted_score(0.0, population) in Rust."""
+
+    def test_constants_match_rust(self):
+        assert POPULATION_BOOST_MULTIPLIER == rust_constant("POPULATION_BOOST_MULTIPLIER")
+        assert MISSING_POPULATION_PENALTY == rust_constant("MISSING_POPULATION_PENALTY")
+
+    @pytest.mark.parametrize("population", [None, 0, 1, 999, 8_000_000])
+    def test_expression_matches_rust_formula(self, population):
+        con = duckdb.connect()
+        (offset,) = con.execute(
+            f"SELECT {BOOST_OFFSET_SQL} FROM (SELECT ?::BIGINT AS population)",
+            [population],
+        ).fetchone()
+        con.close()
+
+        if population:
+            expected = -math.log(population + 1) * rust_constant("POPULATION_BOOST_MULTIPLIER")
+        else:
+            expected = -rust_constant("MISSING_POPULATION_PENALTY")
+        assert offset == pytest.approx(expected)
+
+
+@pytest.fixture(scope="module")
+def divisions_parquet(tmp_path_factory):
+    """Small divisions parquet with both forward and reverse columns."""
+    con = duckdb.connect()
+    try:
+        con.execute("INSTALL sqlite; LOAD sqlite;")
+    except duckdb.Error as e:
+        pytest.skip(f"DuckDB sqlite extension unavailable: {e}")
+
+    path = tmp_path_factory.mktemp("parquet") / "divisions.parquet"
+    con.execute(f"""
+        COPY (
+            SELECT * FROM (VALUES
+                ('g1', 1, 'locality', 'Springfield', 42.1, -72.6,
+                 -72.7, 42.0, -72.5, 42.2, 0.04, 155000, 'US', 'US-MA', 'springfield massachusetts'),
+                ('g2', 1, 'county', 'Hampden County', 42.1, -72.6,
+                 -73.1, 41.9, -72.0, 42.3, 0.55, NULL, 'US', 'US-MA', 'hampden county massachusetts'),
+                ('g3', 1, 'locality', 'Lyon', 45.7, 4.8,
+                 4.7, 45.6, 4.9, 45.8, 0.05, 0, 'FR', 'FR-ARA', 'lyon')
+            ) AS t(gers_id, version, subtype, primary_name, lat, lon,
+                   bbox_xmin, bbox_ymin, bbox_xmax, bbox_ymax, area,
+                   population, country, region, search_text)
+        ) TO '{path}' (FORMAT parquet)
+    """)
+    con.close()
+    return path
+
+
+class TestBuildCountryShard:
+    def test_count_and_bbox(self, divisions_parquet, tmp_path):
+        # Quote in the path exercises escaping of the ATTACH literal
+        output = tmp_path / "it's" / "US.db"
+        info = build_country_shard(divisions_parquet, "US", output, "v1")
+
+        assert info["record_count"] == 2
+        assert info["bbox"] == [-73.1, 41.9, -72.0, 42.3]
+
+    def test_empty_shard_has_inverted_bbox(self, divisions_parquet, tmp_path):
+        info = build_country_shard(divisions_parquet, "DE", tmp_path / "DE.db", "v1")
+
+        assert info["record_count"] == 0
+        assert info["bbox"] == [180.0, 90.0, -180.0, -90.0]
+
+    def test_fts_match(self, divisions_parquet, tmp_path):
+        output = tmp_path / "US.db"
+        build_country_shard(divisions_parquet, "US", output, "v1")
+
+        db = sqlite3.connect(output)
+        rows = db.execute("""
+            SELECT d.gers_id FROM divisions_fts
+            JOIN divisions d ON divisions_fts.rowid = d.rowid
+            WHERE divisions_fts MATCH 'massachusett*'
+            ORDER BY d.gers_id
+        """).fetchall()
+        db.close()
+
+        assert rows == [("g1",), ("g2",)]
+
+    def test_boost_offset(self, divisions_parquet, tmp_path):
+        output = tmp_path / "shards"
+        build_country_shard(divisions_parquet, "US", output / "US.db", "v1")
+        build_country_shard(divisions_parquet, "FR", output / "FR.db", "v1")
+
+        offsets = {}
+        for name in ("US.db", "FR.db"):
+            db = sqlite3.connect(output / name)
+            offsets.update(db.execute("SELECT gers_id, boost_offset FROM divisions"))
+            db.close()
+
+        assert offsets["g1"] == pytest.approx(-math.log(155001) * 2.0)
+        assert offsets["g2"] == -2.0  # NULL population
+        assert offsets["g3"] == -2.0  # Zero population
+
+
+class TestBuildReverseCountryShard:
+    def test_rtree_covers_all_rows(self, divisions_parquet, tmp_path):
+        output = tmp_path / "US.db"
+        info = build_reverse_country_shard(divisions_parquet, "US", output, "v1")
+
+        db = sqlite3.connect(output)
+        rtree_count = db.execute("SELECT COUNT(*) FROM divisions_rtree").fetchone()[0]
+        hits = db.execute("""
+            SELECT d.gers_id FROM divisions_rtree r
+            JOIN divisions_reverse d ON d.rowid = r.id
+            WHERE r.xmin <= -72.6 AND r.xmax >= -72.6
+              AND r.ymin <= 42.1 AND r.ymax >= 42.1
+            ORDER BY d.area
+        """).fetchall()
+        db.close()
+
+        assert info["record_count"] == 2
+        assert rtree_count == 2
+        assert hits == [("g1",), ("g2",)]